@@ -48,9 +48,10 @@ Please make sure to update tests as appropriate.
 - [8] ISO 9613-1:1993 - Acoustics - Attenuation of sound during propagation outdoors - Part 1: Calculation of the absorption of sound by the atmosphere, Geneve., 1993.
 
 """
-from .attenuation import attenuation_coefficient
+from .attenuation import attenuation_coefficient, attenuate_rays
 from .experimental_absorption import eq_absorption_area, absorption_coeff_ISO_354
 from .models import t60_sabine, t60_eyring, t60_mellington, t60_csn730525
+from .models import t60_csn730525_batch
 from .models import calc_alpha_mean
 from .standard import ROOM_TYPES
 from .rt_imports import DiracReverberationData, REWReverberationData, REW_QUANTITIES, merge_rew_dfs
@@ -1,16 +1,32 @@
 """Sound attenuation in air
 """
+import math
 import numpy as np
 from pandas import Series
 
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional
+    ne = None
+
+# conversion of the attenuation from dB/m to m⁻¹, 1 / (10 * log10(e))
+_NEPER_PER_DB = math.log(10.0) / 10.0
+
+# math.cbrt is only available since Python 3.11
+_cbrt = getattr(math, "cbrt", lambda x: x ** (1 / 3))
+
+# below this size the numexpr call overhead outweighs the fused evaluation
+NUMEXPR_MIN_SIZE = 4096
+
 def attenuation_coefficient(
     frequency: float | np.ndarray | Series,
-    relative_humidity: float,
-    temperature: float,
-    pressure: float,
+    relative_humidity: float | np.ndarray,
+    temperature: float | np.ndarray,
+    pressure: float | np.ndarray,
     norm_pressure = 101.325,
-    temp_ref = 293.15
-    ) -> Series:
+    temp_ref = 293.15,
+    out: np.ndarray | None = None
+    ) -> float | np.ndarray | Series:
     r"""
     Calculate the sound attenuation coefficient in air based on the given criteria.
     According to ISO 9613-1:1993.
@@ -19,21 +35,29 @@ def attenuation_coefficient(
     ----------
     frequency : float|np.ndarray|Series
         Frequency bands for the calculation. [Hz]
-    relative_humidity : float
+    relative_humidity : float|np.ndarray
         Relative humidity at the time of measurement. [%]
-    temperature : float
+    temperature : float|np.ndarray
         Air temperature at the time of measurement. [degC]
-    pressure : float
+    pressure : float|np.ndarray
         Atmospheric pressure at the time of measurement. [kPa]
     norm_pressure : float, optional
         Normal atmospheric pressure (reference). Default is 101.325.
-    temperature_0 : float, optional
+    temp_ref : float, optional
         Reference temperature (20 °C). Default is 293.15.    
+    out : np.ndarray, optional
+        Preallocated float64 array the result is written to, with the 
+        shape of the result as an array. Reusing one buffer avoids an 
+        allocation per call when the function is called in a loop.
 
     Returns
     -------
-    att_coeff : float
-        Sound attenuation coefficient.
+    att_coeff : float|np.ndarray|Series
+        Sound attenuation coefficient, of the same kind as `frequency`. [m⁻¹]
+        If any of `relative_humidity`, `temperature` or `pressure` is 
+        array-like, the result is evaluated on the whole parameter grid 
+        and returned as an np.ndarray of shape 
+        (frequency, relative_humidity, temperature, pressure).
 
     Notes
     -----
@@ -94,7 +118,26 @@ def attenuation_coefficient(
     - $m$ is the sound attenuation coefficient used in the ISO 354 and ISO 3382 standards [m⁻¹]
     """
 
-    f = frequency
+    f = np.atleast_1d(np.asarray(frequency, dtype=np.float64))
+
+    # parameter sweeps are evaluated at once on orthogonal broadcast axes
+    grid = any(
+        np.ndim(x) > 0 for x in (relative_humidity, temperature, pressure)
+    )
+    if grid:
+        f = f.reshape(-1, 1, 1, 1)
+        relative_humidity = np.asarray(
+            relative_humidity, dtype=np.float64).reshape(1, -1, 1, 1)
+        temperature = np.asarray(
+            temperature, dtype=np.float64).reshape(1, 1, -1, 1)
+        pressure = np.asarray(
+            pressure, dtype=np.float64).reshape(1, 1, 1, -1)
+
+    # scalar parameters go straight to libm, grids need the ufuncs
+    if grid:
+        exp, sqrt, cbrt = np.exp, np.sqrt, np.cbrt
+    else:
+        exp, sqrt, cbrt = math.exp, math.sqrt, _cbrt
 
     T = temperature + 273.15
     T_0 = temp_ref
@@ -108,17 +151,103 @@ def attenuation_coefficient(
     
     f_rO = p_a / p_r * (24 + 4.04e4 * h * (0.02 + h)/(0.391 + h))
 
-    f_rN = p_a / p_r * (T / T_0) ** (-0.5) * (
-        9 + 280 * h * np.exp(-4.170 * ((T / T_0) ** (-1/3) - 1))
+    # powers of T / T_0 through sqrt and cbrt instead of general pow
+    Tr = T / T_0
+    Tr_sqrt = sqrt(Tr)
+    Tr_mcbrt = 1.0 / cbrt(Tr)
+    Tr_m52 = 1.0 / (Tr * Tr * Tr_sqrt)
+
+    f_rN = p_a / p_r / Tr_sqrt * (
+        9 + 280 * h * exp(-4.170 * (Tr_mcbrt - 1))
         )
 
-    att_coeff = 8.686 * f ** 2 * (
-        (1.84e-11 * (p_r / p_a) * (T / T_0) ** 0.5)
-        + (T / T_0) ** (-5/2)
-        * (0.01275 * (f_rO + f ** 2 / f_rO) ** (-1) * np.exp(-2239.1 / T)
-        + 0.1068 * (f_rN + f ** 2 / f_rN) ** (-1) * np.exp(-3352.0 / T))
+    # frequency independent factors, evaluated once per parameter set
+    inv_frO = 1.0 / f_rO
+    inv_frN = 1.0 / f_rN
+    classical = 1.84e-11 * (p_r / p_a) * Tr_sqrt
+    kO = 0.01275 * exp(-2239.1 / T) * Tr_m52
+    kN = 0.1068 * exp(-3352.0 / T) * Tr_m52
+    scale = 8.686 * _NEPER_PER_DB
+
+    if ne is not None and f.size >= NUMEXPR_MIN_SIZE:
+        # single fused, multithreaded pass without intermediate arrays
+        att_coeff = ne.evaluate(
+            "scale * f**2 * (classical"
+            " + kO / (f_rO + f**2 * inv_frO)"
+            " + kN / (f_rN + f**2 * inv_frN))",
+            local_dict={
+                "f": f, "scale": scale, "classical": classical,
+                "kO": kO, "kN": kN, "f_rO": f_rO, "f_rN": f_rN,
+                "inv_frO": inv_frO, "inv_frN": inv_frN,
+            },
+            out=out,
         )
-    print(att_coeff)
+    else:
+        # frequency dependent part, evaluated in place to limit temporaries
+        f2 = f * f
+        if out is None:
+            out = np.empty(np.broadcast_shapes(f2.shape, np.shape(f_rO)))
+        att_coeff = np.multiply(f2, inv_frO, out=out)
+        att_coeff += f_rO
+        np.reciprocal(att_coeff, out=att_coeff)
+        att_coeff *= kO
+        tmp = f2 * inv_frN
+        tmp += f_rN
+        np.reciprocal(tmp, out=tmp)
+        tmp *= kN
+        att_coeff += tmp
+        att_coeff += classical
+        att_coeff *= f2
+        att_coeff *= scale
+
+    if grid:
+        return att_coeff[0] if np.ndim(frequency) == 0 else att_coeff
+    if isinstance(frequency, Series):
+        return Series(att_coeff, index=frequency.index, name=frequency.name)
+    if np.ndim(frequency) == 0:
+        return float(att_coeff[0])
+    return att_coeff
+
+def attenuate_rays(
+    lengths: np.ndarray,
+    att_coeff: np.ndarray,
+    out: np.ndarray | None = None
+    ) -> np.ndarray:
+    r"""
+    Calculate the energy attenuation of sound rays travelling through air.
 
-    att_coeff = att_coeff / (10 * np.log10(np.exp(1)))
-    return att_coeff
\ No newline at end of file
+    Parameters
+    ----------
+    lengths : np.ndarray
+        Lengths of the ray segments. [m]
+    att_coeff : np.ndarray
+        Sound attenuation coefficient for each frequency band, as returned
+        by `attenuation_coefficient`. [m⁻¹]
+    out : np.ndarray, optional
+        Preallocated float64 array of shape (rays, bands) the result is
+        written to.
+
+    Returns
+    -------
+    np.ndarray
+        Energy attenuation factor of shape (rays, bands). [-]
+
+    Notes
+    -----
+    The energy attenuation factor is calculated using the formula:
+    $$
+    D = e^{-m \cdot d}
+    $$
+    where:
+    - $m$ is the sound attenuation coefficient [m⁻¹]
+    - $d$ is the length of the ray segment [m]
+    """
+    d = np.asarray(lengths, dtype=np.float64).reshape(-1, 1)
+    m = np.asarray(att_coeff, dtype=np.float64).reshape(1, -1)
+
+    if ne is not None and d.size * m.size >= NUMEXPR_MIN_SIZE:
+        return ne.evaluate(
+            "exp(-m * d)", local_dict={"m": m, "d": d}, out=out
+        )
+    out = np.multiply(d, -m, out=out)
+    return np.exp(out, out=out)
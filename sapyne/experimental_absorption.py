@@ -109,8 +109,8 @@ def absorption_coeff_ISO_354_std(
     - $\sigma_{A_r}$ is the standard deviation of the total absorption of the empty room [m²]
     - $S$ is the area of the sample specimen [m²]
     """
-    return np.sqrt(
-        absorption_sample_std**2 + absorption_reference_std**2
+    return np.hypot(
+        absorption_sample_std, absorption_reference_std
     ) / specimen_area
 
 def absorption_coeff_ISO_354(
@@ -9,30 +9,83 @@ Functions:
 - `t60_eyring`: Calculate T60 using the Eyring formula.
 - `t60_mellington`: Calculate T60 using the Mellington formula.
 - `t60_csn730525`: Calculate T60 using the CSN 730525 standard.
+- `t60_csn730525_batch`: Calculate T60 using the CSN 730525 standard for 
+  many samples at once.
 """
-from .room import BANDS
+from .room import BANDS, _band_positions
 from pandas import DataFrame, Series
 import numpy as np
+import logging
+
+_log = logging.getLogger(__name__)
+
+def _prep(
+        absorption: DataFrame | np.ndarray,
+        attenuation: Series | np.ndarray | None,
+        bands: list
+) -> tuple:
+    """Convert the inputs to float ndarrays once at the API boundary.
+
+    Returns the absorption summed over all rows for each band and the
+    attenuation aligned to the bands (None if not given).
+    """
+    if isinstance(absorption, DataFrame):
+        # positional lookup of all bands in one hashtable pass
+        absorption = absorption.iloc[:, _band_positions(absorption.columns, bands)]
+    absorption_sum = np.asarray(absorption, dtype=np.float64).sum(axis=0)
+    if attenuation is None:
+        attenuation_arr = None
+    elif isinstance(attenuation, Series):
+        attenuation_arr = attenuation.iloc[
+            _band_positions(attenuation.index, bands)
+        ].to_numpy(dtype=np.float64)
+    else:
+        attenuation_arr = np.asarray(attenuation, dtype=np.float64)
+    return absorption_sum, attenuation_arr
+
+def _wrap(
+        values: np.ndarray,
+        absorption: DataFrame | np.ndarray,
+        bands: list
+) -> Series | np.ndarray:
+    """Return a Series for DataFrame input and a plain ndarray otherwise."""
+    if isinstance(absorption, DataFrame):
+        return Series(values, index=bands)
+    return values
+
+def _eyring_area(absorption_sum: np.ndarray, surface_sum: float) -> np.ndarray:
+    """Equivalent absorption area of the Eyring model, -S ln(1 - alpha)."""
+    return - surface_sum * np.log1p(-absorption_sum / surface_sum)
+
+def _t60_from_area(
+        area: np.ndarray,
+        volume: float,
+        constant: float
+) -> np.ndarray:
+    """Reverberation time from the equivalent absorption area."""
+    return constant * volume / area
 
 def calc_alpha_mean(
-        absorption: DataFrame,
+        absorption: DataFrame | np.ndarray,
         surface_sum: float,
         bands: list = BANDS
-) -> Series:
+) -> Series | np.ndarray:
     r"""
     Calculate the mean absorption coefficient.
 
     Parameters
     ----------
-    absorption : DataFrame
-        Absorption data for different frequencies.
+    absorption : DataFrame|np.ndarray
+        Absorption data for different frequencies. An array of shape 
+        (rows, bands) is taken in the order of `bands`.
     surface_sum : float
         Total surface area of the room [m²].
 
     Returns
     -------
-    Series
-        Mean absorption coefficient for each frequency.
+    Series|np.ndarray
+        Mean absorption coefficient for each frequency, as an ndarray 
+        if `absorption` is an ndarray.
 
     Equation
     --------
@@ -44,21 +97,23 @@ def calc_alpha_mean(
     - $\sum \alpha$ is the sum of absorption coefficients
     - $S$ is the total surface area [m²]
     """
-    return absorption.loc[:, bands].sum() / surface_sum
+    absorption_sum, _ = _prep(absorption, None, bands)
+    return _wrap(absorption_sum / surface_sum, absorption, bands)
 
 def t60_sabine(
-        absorption: DataFrame,
+        absorption: DataFrame | np.ndarray,
         volume: float,
         constant: float = 0.163,
         bands: list = BANDS
-) -> Series:
+) -> Series | np.ndarray:
     r"""
     Calculate T60 using the Sabine formula.
 
     Parameters
     ----------
-    absorption : DataFrame
-        Absorption data for different frequencies.
+    absorption : DataFrame|np.ndarray
+        Absorption data for different frequencies. An array of shape 
+        (rows, bands) is taken in the order of `bands`.
     volume : float
         Volume of the room [m³].
     constant : float, optional
@@ -66,8 +121,9 @@ def t60_sabine(
 
     Returns
     -------
-    Series
-        T60 for each frequency [s].
+    Series|np.ndarray
+        T60 for each frequency, as an ndarray if `absorption` is an 
+        ndarray [s].
 
     Equation
     --------
@@ -79,23 +135,25 @@ def t60_sabine(
     - $V$ is the volume of the room [m³]
     - $\sum \alpha$ is the sum of absorption coefficients
     """
-    t60 = constant * volume / absorption.loc[:, bands].sum()
-    return t60
+    absorption_sum, _ = _prep(absorption, None, bands)
+    t60 = _t60_from_area(absorption_sum, volume, constant)
+    return _wrap(t60, absorption, bands)
 
 def t60_eyring(
-        absorption: DataFrame,
+        absorption: DataFrame | np.ndarray,
         volume: float,
         surface_sum: float,
         constant: float = 0.163,
         bands: list = BANDS
-) -> Series:
+) -> Series | np.ndarray:
     r"""
     Calculate T60 using the Eyring formula.
 
     Parameters
     ----------
-    absorption : DataFrame
-        Absorption data for different frequencies.
+    absorption : DataFrame|np.ndarray
+        Absorption data for different frequencies. An array of shape 
+        (rows, bands) is taken in the order of `bands`.
     volume : float
         Volume of the room [m³].
     surface_sum : float
@@ -105,8 +163,9 @@ def t60_eyring(
 
     Returns
     -------
-    Series
-        T60 for each frequency [s].
+    Series|np.ndarray
+        T60 for each frequency, as an ndarray if `absorption` is an 
+        ndarray [s].
 
     Equation
     --------
@@ -119,46 +178,53 @@ def t60_eyring(
     - $S$ is the total surface area [m²]
     - $\alpha_{\text{mean}}$ is the mean absorption coefficient
     """
-    alpha_mean = calc_alpha_mean(absorption, surface_sum, bands)
-    print("alpha_mean", alpha_mean)
-    print("surface_sum", surface_sum)
-    print(np.log(1 - np.array(alpha_mean, dtype=float)))
-    t60 = constant * volume / (- surface_sum * np.log(1 - np.array(alpha_mean, dtype=float)))
-    return t60
+    absorption_sum, _ = _prep(absorption, None, bands)
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug(
+            "alpha_mean %s, surface_sum %s", 
+            absorption_sum / surface_sum, surface_sum
+        )
+    t60 = _t60_from_area(
+        _eyring_area(absorption_sum, surface_sum), volume, constant
+    )
+    return _wrap(t60, absorption, bands)
 
 def t60_mellington(
-        absorption: DataFrame,
+        absorption: DataFrame | np.ndarray,
         volume: float,
         surface_sum: float,
-        attenuation: Series,
+        attenuation: Series | np.ndarray,
         constant: float = 0.163,
         bands: list = BANDS
-) -> Series:
+) -> Series | np.ndarray:
     r"""
     Calculate T60 using the Mellington formula.
 
     Parameters
     ----------
-    absorption : DataFrame
-        Absorption data for different frequencies.
+    absorption : DataFrame|np.ndarray
+        Absorption data for different frequencies. An array of shape 
+        (rows, bands) is taken in the order of `bands`.
     volume : float
         Volume of the room [m³].
     surface_sum : float
         Total surface area [m²].
-    attenuation : Series
-        Attenuation data for different frequencies.
+    attenuation : Series|np.ndarray
+        Attenuation data for different frequencies. A Series is aligned 
+        to `bands` by its index, an array is taken in the order of `bands`.
     constant : float, optional
         A constant, default is 0.163.
 
     Returns
     -------
-    Series
-        T60 for each frequency [s].
+    Series|np.ndarray
+        T60 for each frequency, as an ndarray if `absorption` is an 
+        ndarray [s].
 
     Equation
     --------
     $$
-    T_{60} = \frac{0.163 \cdot V}{-S \cdot \ln(1 - \alpha_{\text{mean}}) - 4 \cdot m \cdot V}
+    T_{60} = \frac{0.163 \cdot V}{-S \cdot \ln(1 - \alpha_{\text{mean}}) + 4 \cdot m \cdot V}
     $$
     where:
     - $T_{60}$ is the reverberation time [s]
@@ -167,60 +233,125 @@ def t60_mellington(
     - $\alpha_{\text{mean}}$ is the mean absorption coefficient
     - $m$ is the attenuation coefficient [m⁻¹]
     """
-    alpha_mean = calc_alpha_mean(absorption, surface_sum, bands)
-    t60 = constant * volume / (
-            - surface_sum * np.log(1 - alpha_mean) + 4 * attenuation * volume
+    absorption_sum, attenuation = _prep(absorption, attenuation, bands)
+    t60 = _t60_from_area(
+        _eyring_area(absorption_sum, surface_sum) + (4 * volume) * attenuation,
+        volume,
+        constant
     )
-    return t60
+    return _wrap(t60, absorption, bands)
 
 def t60_csn730525(
-        absorption: DataFrame,
+        absorption: DataFrame | np.ndarray,
         volume: float,
         surface_sum: float,
-        attenuation: Series,
+        attenuation: Series | np.ndarray,
         constant: float = 0.163,
         bands: list = BANDS
-) -> Series:
+) -> Series | np.ndarray:
     r"""
     Calculate T60 using the CSN 730525 standard.
 
     Parameters
     ----------
-    absorption : DataFrame
-        Absorption data for different frequencies.
+    absorption : DataFrame|np.ndarray
+        Absorption data for different frequencies. An array of shape 
+        (rows, bands) is taken in the order of `bands`.
     volume : float
         Volume of the room [m³].
     surface_sum : float
         Total surface area [m²].
-    attenuation : Series
-        Attenuation data for different frequencies.
+    attenuation : Series|np.ndarray
+        Attenuation data for different frequencies. A Series is aligned 
+        to `bands` by its index, an array is taken in the order of `bands`.
     constant : float, optional
         A constant, default is 0.163.
 
     Returns
     -------
-    Series
-        T60 for each frequency [s].
+    Series|np.ndarray
+        T60 for each frequency, as an ndarray if `absorption` is an 
+        ndarray [s].
 
     Notes
     -----
-    The method uses different formulas based on the mean absorption coefficient and volume:
+    The method uses different formulas based on the mean absorption coefficient 
+    and volume, selected for each frequency band separately:
     - Sabine formula if $\alpha_{\text{mean}} < 0.2$ and $V < 2000$ m³
-    - Eyring formula if $0.2 < \alpha_{\text{mean}} < 0.8$ and $V < 2000$ m³
+    - Eyring formula if $0.2 \leq \alpha_{\text{mean}} < 0.8$ and $V < 2000$ m³
     - Mellington formula otherwise
     """
-    alpha_mean = calc_alpha_mean(absorption, surface_sum, bands)
-    print("alpha_mean", alpha_mean)
-    print("surface_sum", surface_sum)
-    print(np.log(1 - np.array(alpha_mean, dtype=float)))
-    if np.any(alpha_mean<0.8) and np.any(alpha_mean>0.2) and volume < 2000:
-        t60 = t60_eyring(absorption, volume, surface_sum, constant)
-        print("Using Eyring formula")
-    elif np.any(alpha_mean<0.2) and volume < 2000:
-        t60 = t60_sabine(absorption, volume, constant, bands)
-        print("Using Sabine formula")
-    else:
-        t60 = t60_mellington(absorption, volume, surface_sum, attenuation, constant)
+    absorption_sum, attenuation = _prep(absorption, attenuation, bands)
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug(
+            "alpha_mean %s, surface_sum %s", 
+            absorption_sum / surface_sum, surface_sum
+        )
+    t60 = _t60_csn730525_arr(
+        absorption_sum, volume, surface_sum, attenuation, constant
+    )
+    return _wrap(t60, absorption, bands)
+
+def t60_csn730525_batch(
+        absorption: np.ndarray,
+        volume: float | np.ndarray,
+        surface_sum: float | np.ndarray,
+        attenuation: np.ndarray,
+        constant: float = 0.163
+) -> np.ndarray:
+    r"""
+    Calculate T60 using the CSN 730525 standard for many samples at once.
+
+    Vectorized variant of `t60_csn730525` for Monte-Carlo or bootstrap
+    uncertainty propagation, where the absorption and attenuation are 
+    drawn many times.
 
-        print("Using Mellington formula")
-    return t60
\ No newline at end of file
+    Parameters
+    ----------
+    absorption : np.ndarray
+        Absorption data of shape (samples, rows, bands) [m²].
+    volume : float|np.ndarray
+        Volume of the room, scalar or of shape (samples,) [m³].
+    surface_sum : float|np.ndarray
+        Total surface area, scalar or of shape (samples,) [m²].
+    attenuation : np.ndarray
+        Attenuation data of shape (samples, bands) or (bands,) [m⁻¹].
+    constant : float, optional
+        A constant, default is 0.163.
+
+    Returns
+    -------
+    np.ndarray
+        T60 of shape (samples, bands) [s].
+    """
+    absorption_sum = np.asarray(absorption, dtype=np.float64).sum(axis=1)
+    attenuation = np.asarray(attenuation, dtype=np.float64)
+    # per-sample room geometry broadcasts against the band axis
+    volume = np.asarray(volume, dtype=np.float64).reshape(-1, 1)
+    surface_sum = np.asarray(surface_sum, dtype=np.float64).reshape(-1, 1)
+    return _t60_csn730525_arr(
+        absorption_sum, volume, surface_sum, attenuation, constant
+    )
+
+def _t60_csn730525_arr(
+        absorption_sum: np.ndarray,
+        volume: float,
+        surface_sum: float,
+        attenuation: np.ndarray,
+        constant: float
+) -> np.ndarray:
+    """Select the CSN 730525 formula per band from the band sums."""
+    # all three formulas share the band sums and the Eyring area
+    alpha_mean = absorption_sum / surface_sum
+    eyring_area = _eyring_area(absorption_sum, surface_sum)
+    sabine = _t60_from_area(absorption_sum, volume, constant)
+    eyring = _t60_from_area(eyring_area, volume, constant)
+    mellington = _t60_from_area(
+        eyring_area + (4 * volume) * attenuation, volume, constant
+    )
+    small = volume < 2000
+    return np.where(
+        small & (alpha_mean < 0.2),
+        sabine,
+        np.where(small & (alpha_mean < 0.8), eyring, mellington)
+    )
@@ -14,12 +14,106 @@ Classes
 """
 from pandas import DataFrame
 import pandas as pd
+import numpy as np
+import logging
 
-BANDS = ["125", "250", "500", "1000", "2000", "4000"]
+_log = logging.getLogger(__name__)
+
+BANDS = [125, 250, 500, 1000, 2000, 4000]
 IDENTIFIERS = ["ID", "Name"]
 AREA = "Area"
 AMOUNT = "Amount"
 
+# shared column index of the bands, built once instead of on every 
+# DataFrame construction
+_BAND_INDEX = pd.Index(BANDS)
+
+def _band_positions(columns: pd.Index, bands: list = BANDS) -> np.ndarray:
+    """Positions of the band columns, labelled either by numbers or by 
+    strings (e.g. library tables read from csv files)."""
+    idx = columns.get_indexer(bands)
+    if (idx < 0).any():
+        idx = columns.get_indexer([str(b) for b in bands])
+    if (idx < 0).any():
+        raise KeyError("Bands not found in the columns. ({})".format(list(bands)))
+    return idx
+
+def _library_entry(library: DataFrame, material_id: str):
+    """Name and absorption coefficients of the first library entry 
+    with the given ID, read without copying the matching rows."""
+    matches = np.flatnonzero(library["ID"].to_numpy() == material_id)
+    if not matches.size:
+        raise ValueError("Material ID not found in the library")
+    row = matches[0]
+    bands = library.iloc[row, _band_positions(library.columns)].to_numpy(
+        dtype=np.float64)
+    return library["Name"].iat[row], bands
+
+class _AbsorptionTable:
+    """Structure-of-arrays storage of surfaces or objects.
+
+    The identifiers are kept in lists, the quantity (area or amount)
+    and the absorption coefficients in contiguous float64 buffers 
+    which grow by doubling their capacity.
+
+    Structure:
+    ----------
+    quantity_col : str
+        Name of the quantity column, AREA or AMOUNT.
+    ids : list
+        Material IDs.
+    names : list
+        Material names.
+    size : int
+        Number of stored rows.
+    """
+    def __init__(self, quantity_col: str, df: DataFrame):
+        self.quantity_col = quantity_col
+        self.ids = df["ID"].tolist()
+        self.names = df["Name"].tolist()
+        self.size = len(df)
+        capacity = max(self.size, 8)
+        self._quantity = np.empty(capacity, dtype=np.float64)
+        self._bands = np.empty((capacity, len(BANDS)), dtype=np.float64)
+        self._quantity[:self.size] = df[quantity_col].to_numpy(dtype=np.float64)
+        self._bands[:self.size] = df.iloc[:, _band_positions(df.columns)].to_numpy(
+            dtype=np.float64)
+
+    @property
+    def quantity(self) -> np.ndarray:
+        """View of the stored areas or amounts."""
+        return self._quantity[:self.size]
+
+    @property
+    def bands(self) -> np.ndarray:
+        """View of the stored absorption coefficients, (rows, bands)."""
+        return self._bands[:self.size]
+
+    def append(self, ids: list, names: list, quantity, bands: np.ndarray):
+        """Append rows, growing the buffers geometrically if needed."""
+        n = len(ids)
+        if self.size + n > len(self._quantity):
+            capacity = max(2 * len(self._quantity), self.size + n)
+            quantity_buf = np.empty(capacity, dtype=np.float64)
+            bands_buf = np.empty((capacity, len(BANDS)), dtype=np.float64)
+            quantity_buf[:self.size] = self.quantity
+            bands_buf[:self.size] = self.bands
+            self._quantity = quantity_buf
+            self._bands = bands_buf
+        self._quantity[self.size:self.size + n] = quantity
+        self._bands[self.size:self.size + n] = bands
+        self.ids.extend(ids)
+        self.names.extend(names)
+        self.size += n
+
+    def to_frame(self) -> DataFrame:
+        """Assemble the table as a DataFrame."""
+        df = DataFrame(self.bands.copy(), columns=_BAND_INDEX)
+        df.insert(0, "ID", self.ids)
+        df.insert(1, "Name", self.names)
+        df.insert(2, self.quantity_col, self.quantity.copy())
+        return df
+
 class Room:
     """Room object for reverberation time calculations
     according to Sabine and similar models.
@@ -32,8 +126,8 @@ class Room:
             temperature : float,
             humidity : float,
             pressure: float,
-            surfaces : DataFrame = DataFrame(columns=["ID", "Name", "Area"] + BANDS),
-            objects : DataFrame = DataFrame(columns=["ID", "Name", "Amount"] + BANDS)
+            surfaces : DataFrame | None = None,
+            objects : DataFrame | None = None
             ):
         """Room object for reverberation time calculations
         according to Sabine and similar models.
@@ -52,17 +146,18 @@ class Room:
             Assumed relative humidity [%]
         pressure : float
             Assumed atmospheric pressure [kPa]
-        surfaces : DataFrame
+        surfaces : DataFrame, optional
             pandas.DataFrame containing absorption coefficient data.
+            An empty table is created if not given.
             The required columns are:
             - "ID" (material id from the library)
             - "Name" (material name from the library)
             - "Area" (area in the room)
             - 125 ... 4000 (central frequencies of the octave bands 
                     typically used in room acoustics)
-        objects : DataFrame
+        objects : DataFrame, optional
             pandas.DataFrame containing absorption data about objects.
-            The required columns are:
+            An empty table is created if not given.
             The required columns are:
             - "ID" (material id from the library)
             - "Name" (material name from the library)
@@ -77,12 +172,59 @@ class Room:
         self.temperature = temperature
         self.humidity = humidity
         self.pressure = pressure
-        self.surfaces = surfaces
-        self.objects = objects
-        self.absorption = None
+        if surfaces is None:
+            surfaces = DataFrame(columns=IDENTIFIERS + [AREA] + BANDS)
+        if objects is None:
+            objects = DataFrame(columns=IDENTIFIERS + [AMOUNT] + BANDS)
+        # numeric data are kept as arrays, DataFrames are built on demand
+        self._surfaces = _AbsorptionTable(AREA, surfaces)
+        self._objects = _AbsorptionTable(AMOUNT, objects)
+        # absorption is recomputed lazily after surfaces or objects change
+        self._cached_absorption = None
+        self._absorption_dirty = True
 
         # write checks for the required columns in surfaces and objects
         # raise an error if not fulfilled
+
+    @property
+    def surfaces(self) -> DataFrame:
+        """Surfaces of the room.
+
+        The DataFrame is assembled on each access, assign a new 
+        DataFrame to replace the surfaces.
+        """
+        return self._surfaces.to_frame()
+
+    @surfaces.setter
+    def surfaces(self, surfaces: DataFrame):
+        self._surfaces = _AbsorptionTable(AREA, surfaces)
+        self._absorption_dirty = True
+
+    @property
+    def objects(self) -> DataFrame:
+        """Objects in the room.
+
+        The DataFrame is assembled on each access, assign a new 
+        DataFrame to replace the objects.
+        """
+        return self._objects.to_frame()
+
+    @objects.setter
+    def objects(self, objects: DataFrame):
+        self._objects = _AbsorptionTable(AMOUNT, objects)
+        self._absorption_dirty = True
+
+    @property
+    def absorption(self) -> DataFrame:
+        """Absorption of the surfaces and objects [m^2].
+
+        Recalculated only if the surfaces or objects changed since 
+        the last access.
+        """
+        if self._absorption_dirty:
+            self._recompute_absorption()
+        return self._cached_absorption
+
     def add_surface(
             self, 
             library: DataFrame, 
@@ -106,26 +248,32 @@ class Room:
             ID of the material in the library
         area : float
             Area of the surface [m^2]
-        subtract_area_from : str
-            ID of the surface to subtract the area from. 
+        subtract_area_from : str, optional
+            Name of the surface to subtract the area from. 
             This is useful for windows and doors, where the area 
-            is subtracted from the wall area.
+            is subtracted from the wall area. Only the area of all 
+            surfaces with this name is reduced.
+        renamed_surface : str, optional
+            Name of the added surface, the library name is used 
+            if not given.
         """
-        material = library.loc[library["ID"] == material_id].copy()
-        if material.empty:
-            raise ValueError("Material ID not found in the library")
-        
-        material.loc[:, "Area"] = area
+        name, bands = _library_entry(library, material_id)
+
         if subtract_area_from is not None:
-            subtracted_surface = self.surfaces[self.surfaces["Name"] == subtract_area_from]
-            if subtracted_surface.empty:
-                raise ValueError("Subtracted surface ID not found in the room")
-            self.surfaces.loc[self.surfaces["Name"] == subtract_area_from, "Area"] -= area
+            mask = np.array(self._surfaces.names, dtype=object) == subtract_area_from
+            if not mask.any():
+                raise ValueError(
+                    "Subtracted surface not found in the room. ({})".format(
+                        subtract_area_from
+                    )
+                )
+            self._surfaces.quantity[mask] -= area
 
         if renamed_surface is not None:
-            material.loc[:, "Name"] = renamed_surface
+            name = renamed_surface
 
-        self.surfaces = pd.concat([self.surfaces, material])
+        self._surfaces.append([material_id], [name], area, bands)
+        self._absorption_dirty = True
 
     def add_object(
             self, 
@@ -149,25 +297,27 @@ class Room:
         amount : float
             Amount of the object in the room [m^2]
         """
-        material = library.loc[library["ID"] == material_id].copy()
-        if material.empty:
-            raise ValueError("Material ID not found in the library")
-        
-        material.loc[:, "Amount"] = amount
-        self.objects = pd.concat([self.objects, material])
-
-    def update_absorption(self):
-        # does a complete recalculation. TODO think of a more efficient way.
-        absorption_surfaces = self.surfaces[IDENTIFIERS]
-        absorption_objects = self.objects[IDENTIFIERS]
-        # print(self.surfaces.loc[:, BANDS])
-        # print(self.surfaces.loc[:, AREA])
-        # print(self.surfaces.loc[:, BANDS].mul(self.surfaces.loc[:, AREA], axis=0))
-        absorption_surfaces.loc[:, BANDS] = self.surfaces.loc[:, BANDS].mul(self.surfaces.loc[:, AREA], axis=0)
-        absorption_objects.loc[:, BANDS] = self.objects.loc[:, BANDS].mul(self.objects.loc[:, AMOUNT], axis=0)
-        
-        self.absorption = pd.concat([
-            absorption_surfaces,
-            absorption_objects
-        ], axis=0)
-        return self.absorption        
\ No newline at end of file
+        name, bands = _library_entry(library, material_id)
+        self._objects.append([material_id], [name], amount, bands)
+        self._absorption_dirty = True
+
+    def update_absorption(self) -> DataFrame:
+        """Force the recalculation of the absorption and return it."""
+        self._recompute_absorption()
+        return self._cached_absorption
+
+    def _recompute_absorption(self):
+        surfaces = self._surfaces
+        objects = self._objects
+        absorption = np.vstack([
+            surfaces.bands * surfaces.quantity[:, None],
+            objects.bands * objects.quantity[:, None]
+        ])
+
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("absorption of %s:\n%s", self.name, absorption)
+        df = DataFrame(absorption, columns=_BAND_INDEX)
+        df.insert(0, "ID", surfaces.ids + objects.ids)
+        df.insert(1, "Name", surfaces.names + objects.names)
+        self._cached_absorption = df
+        self._absorption_dirty = False
@@ -29,7 +29,8 @@ the merge_rew_dfs function.
 from typing import List
 import pandas as pd
 import numpy as np
-import re
+
+_DIRAC_SUMMARY_MARKER = "Number of Measurements"
 
 class DiracReverberationData:
     """Representation of Dirac exported reverberation data.
@@ -60,14 +61,31 @@ class DiracReverberationData:
 
     def load_data(self):
         """Load the data from the file."""
-        self.df = pd.read_csv(self.path, sep='\t', decimal=',')
-        # drop the first row of the data
-        self.df = self.df.drop(0)
-        # drop the row having "Number of Measurements" in the first column and the following rows
-        row_idx = self.df[self.df.iloc[:,0].str.strip() == "Number of Measurements"].index
-        self.df = self.df.iloc[:row_idx[0]-1]
+        # find the raw line of the "Number of Measurements" summary, so that
+        # only the measurement rows above it are parsed
+        marker_line = None
+        with open(self.path) as f:
+            for i, line in enumerate(f):
+                if line.lstrip().startswith(_DIRAC_SUMMARY_MARKER):
+                    marker_line = i
+                    break
+        if marker_line is None:
+            raise ValueError(
+                "'{}' not found in the file. ({})".format(
+                    _DIRAC_SUMMARY_MARKER, self.path
+                )
+            )
+        # blank lines are kept so that the rows match the raw lines, 
+        # the header and the following row are not measurements
+        self.df = pd.read_csv(
+            self.path, sep='\t', decimal=',', skiprows=[1], 
+            nrows=marker_line - 2, skip_blank_lines=False
+        )
         self.df = self.df.drop(columns=self.df.columns[0])
-        self.cols = np.array(self.df.columns).astype(float)
+        self.df = self.df.dropna(how="all").reset_index(drop=True)
+        self.cols = self.df.columns.astype(float).to_numpy()
+        # numeric frequency labels, compatible with room.BANDS
+        self.df.columns = self.cols
 
 REW_QUANTITIES = [
     "EDT (s)", "T20 (s)", "T30 (s)", "Topt (s)", 
@@ -75,6 +93,9 @@ REW_QUANTITIES = [
     "D50 (%)", "TS (s)"
 ]
 
+_BAND_FILTERS = {"octave": "1/1", "third": "1/3"}
+_FORMAT_PREFIX = "Format is "
+
 class REWReverberationData:
     """Representation of REW reverberation data file.
     """
@@ -92,37 +113,30 @@ class REWReverberationData:
         """
         self.path = path
         self.bands = bands
-        if bands == "octave":
-            filt_str = "1/1"
-        elif bands == "third":
-            filt_str = "1/3"
-
-        pattern = re.compile(filt_str)
+        try:
+            filt_str = _BAND_FILTERS[bands]
+        except KeyError:
+            raise ValueError("Invalid band resolution. ({}), valid resolutions are: {}".format(bands, list(_BAND_FILTERS)))
+
+        # single pass collecting the metadata, the format line and the 
+        # data lines of the requested band resolution
+        valid_lines = []
+        metadata = []
         with open(path) as f:
-            valid_lines = []
             for lineno, line in enumerate(f):
-                matches = pattern.finditer(line)
-                for m in matches:
-                    # aad the line number to the list if the line starts with a number
-                    if line[0].isdigit():
-                        valid_lines.append(lineno)
+                if lineno < 10:
+                    metadata.append(line)
+                # add the line number to the list if the line starts with a number
+                if line[0].isdigit() and filt_str in line:
+                    valid_lines.append(lineno)
+                elif line.startswith(_FORMAT_PREFIX):
+                    cols = line.strip("\n")[len(_FORMAT_PREFIX):].split(", ")
+        self.metadata = ''.join(metadata)
 
         try:
             assert len(valid_lines) > 0
         except AssertionError:
             raise ValueError("No valid lines found in the file for the specified band resolution. ({})".format(filt_str))
-
-        pattern = re.compile("Format is ")
-        with open(path) as f:
-            for lineno, line in enumerate(f):
-                matches = pattern.finditer(line)
-                for m in matches:
-                    cols = line.strip("\n")
-                    cols = r"'" + cols.replace(", ", r"', '")[len("Format is "):] + r"'"
-                    cols = list(eval(cols))
-        
-        with open(path) as f:
-            self.metadata = ''.join([next(f) for _ in range(10)])
         
         for idx, c in enumerate(cols):
             if c == 'r':
@@ -156,10 +170,10 @@ def merge_rew_dfs(
         assert quantity in REW_QUANTITIES
     except AssertionError:
         raise ValueError("The quantity specified is not valid. ({}), valid quantities are: {}".format(quantity, REW_QUANTITIES))
-    data_dict = {}
-    for d in data:
-        data_dict[d.path] = d.df[quantity]
-    df = pd.DataFrame(data_dict)
-    df = df.T
-    df.columns = d.df["Frequency"]
+    frequency = data[0].df["Frequency"].to_numpy()
+    for d in data[1:]:
+        if not np.array_equal(d.df["Frequency"].to_numpy(), frequency):
+            raise ValueError("The frequency bands of the data differ. ({})".format(d.path))
+    df = pd.concat([d.df[quantity].rename(d.path) for d in data], axis=1).T
+    df.columns = frequency
     return df
\ No newline at end of file
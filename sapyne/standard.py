@@ -4,9 +4,10 @@ mainly the ČSN 73 0527. It defines various room types and their corresponding
 T60 limits, frequency bands, and optimal T60 dependencies based on room volume.
 
 Constants:
-    FREQUENCIES (list): Standard frequency bands.
-    FREQUENCIES_EXTENDED (list): Extended frequency bands.
-    T60_LIMITS (dict): Dictionary containing T60 limits for different room types.
+    FREQUENCIES (np.ndarray): Standard frequency bands.
+    FREQUENCIES_EXTENDED (np.ndarray): Extended frequency bands.
+    T60_LIMITS (dict): Dictionary containing T60 limits (upper, lower) as arrays 
+                       for different room types.
     T_OPT_DEPENDENCY (dict): Dictionary containing lambda functions to calculate 
                              optimal T60 based on room volume.
     VOLUME_LIMITS (dict): Dictionary containing volume limits for different room types.
@@ -24,34 +25,44 @@ from dataclasses import dataclass
 import numpy as np
 
 
-FREQUENCIES = [125, 250, 500, 1000, 2000, 4000]
-FREQUENCIES_EXTENDED = [63, 125, 250, 500, 1000, 2000, 4000, 8000]
+FREQUENCIES = np.array([125, 250, 500, 1000, 2000, 4000], dtype=np.int32)
+FREQUENCIES_EXTENDED = np.array(
+    [63, 125, 250, 500, 1000, 2000, 4000, 8000], dtype=np.int32
+)
 
+# the limits are converted to arrays once, consumers compare against them
+# directly without per-call list conversion
 T60_LIMITS = {
-    "A.2": (
-        [1.45, 1.2, 1.2, 1.2, 1.2, 1.2],
-        [1, 0.8, 0.8, 0.8, 0.8, 0.65]
-    ),
-    "A.3": (
-        [1.45, 1.2, 1.2, 1.2, 1.2, 1.2],
-        [0.8, 0.8, 0.8, 0.8, 0.8, 0.65]
-    ),
-    "A.4": (
-        [1.2, 1.2, 1.2, 1.2, 1.2, 1.2],
-        [0.65, 0.8, 0.8, 0.8, 0.8, 0.65]
-    ),
-    "A.5": (
-        [1.55, 1.3, 1.3, 1.3, 1.3, 1.3],
-        [0.7, 0.7, 0.7, 0.7, 0.7, 0.7]
-    ),
-    "A.7": (
-        [1.5, 1.3, 1.1, 1, 1, 1, 1, 1],
-        [1, 1, 1, 1, 0.9, 0.8, 0.7, 0.6]
-    ),
-    "A.8": (
-        [1.2, 1.2, 1.2, 1.2, 1.2, 1.2],
-        [0.8, 0.8, 0.8, 0.8, 0.8, 0.8]
+    code: (
+        np.asarray(upper, dtype=np.float64),
+        np.asarray(lower, dtype=np.float64)
     )
+    for code, (upper, lower) in {
+        "A.2": (
+            [1.45, 1.2, 1.2, 1.2, 1.2, 1.2],
+            [1, 0.8, 0.8, 0.8, 0.8, 0.65]
+        ),
+        "A.3": (
+            [1.45, 1.2, 1.2, 1.2, 1.2, 1.2],
+            [0.8, 0.8, 0.8, 0.8, 0.8, 0.65]
+        ),
+        "A.4": (
+            [1.2, 1.2, 1.2, 1.2, 1.2, 1.2],
+            [0.65, 0.8, 0.8, 0.8, 0.8, 0.65]
+        ),
+        "A.5": (
+            [1.55, 1.3, 1.3, 1.3, 1.3, 1.3],
+            [0.7, 0.7, 0.7, 0.7, 0.7, 0.7]
+        ),
+        "A.7": (
+            [1.5, 1.3, 1.1, 1, 1, 1, 1, 1],
+            [1, 1, 1, 1, 0.9, 0.8, 0.7, 0.6]
+        ),
+        "A.8": (
+            [1.2, 1.2, 1.2, 1.2, 1.2, 1.2],
+            [0.8, 0.8, 0.8, 0.8, 0.8, 0.8]
+        )
+    }.items()
 }
 
 T_OPT_DEPENDENCY = {
@@ -59,9 +70,9 @@ T_OPT_DEPENDENCY = {
     "A1-2": lambda volume: 0.3582 * np.log10(volume) - 0.061,
     "A1-3": lambda volume: 0.3424 * np.log10(volume) - 0.185,
     "A1-4": lambda volume: 0.1915 * np.log10(volume) + 0.134,
-    "A1-5": lambda volume: (0.3961 * np.log10(volume) + 0.023
-                            if volume < 3000 
-                            else 1.0366 * np.log10(volume) - 2.204),
+    "A1-5": lambda volume: np.where(np.asarray(volume) < 3000,
+                            0.3961 * np.log10(volume) + 0.023,
+                            1.0366 * np.log10(volume) - 2.204),
     "A6": lambda volume: np.array([
         (volume ** 0.2916) / (10 ** 1.1269),
         (volume ** 0.3441) / (10 ** 1.4034)
@@ -77,189 +88,72 @@ VOLUME_LIMITS = {
     "A6": (100, 20000)
 }
 
-@dataclass
+# eq=False keeps identity hashing, field-wise comparison is ambiguous for the
+# array limits
+@dataclass(frozen=True, slots=True, eq=False)
 class RoomType:
     """ Dataclass for room types """
     name: str
     limits: tuple
-    frequencies: list
+    frequencies: np.ndarray
     t_opt_dependency: callable
-    volume_limits: tuple = None
+    volume_limits: tuple | None = None
 
-ROOM_TYPES = {
-    "Opera": RoomType(
-        "Opera", 
-        T60_LIMITS["A.2"], 
-        FREQUENCIES, 
-        T_OPT_DEPENDENCY["A1-1"],
-        VOLUME_LIMITS["A1-1"]
-        ),
-    "Hudební divadlo": RoomType(
-        "Hudební divadlo", 
-        T60_LIMITS["A.2"], 
-        FREQUENCIES, 
-        T_OPT_DEPENDENCY["A1-1"],
-        VOLUME_LIMITS["A1-1"]
-        ),
-    "Zkušebna orchestru": RoomType(
-        "Zkušebna orchestru", 
-        T60_LIMITS["A.2"], 
-        FREQUENCIES, 
-        T_OPT_DEPENDENCY["A1-2"],
-        VOLUME_LIMITS["A1-2"]
-    ),
-    "Víceúčelový sál": RoomType(
-        "Víceúčelový sál", 
-        T60_LIMITS["A.3"], 
-        FREQUENCIES, 
-        T_OPT_DEPENDENCY["A1-2"],
-        VOLUME_LIMITS["A1-2"]
-    ),
-    "Činoherní divadlo": RoomType(
-        "Činoherní divadlo", 
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A1-3"],
-        VOLUME_LIMITS["A1-3"]
-    ),
-    "Zkušebna činohry": RoomType(
-        "Zkušebna činohry", 
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A1-3"],
-        VOLUME_LIMITS["A1-3"]
-    ),
-    "Přednáškový sál": RoomType(
-        "Přednáškový sál", 
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A1-3"],
-        VOLUME_LIMITS["A1-3"]
-    ),
-    "Kino s jednokanálovým zvukem": RoomType(
-        "Kino s jednokanálovým zvukem", 
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A1-4"],
-        VOLUME_LIMITS["A1-4"]
-    ),
-    "Kino s vícekanálovým zvukem analogovým": RoomType(
-        "Kino s vícekanálovým zvukem analogovým", 
-        T60_LIMITS["A.7"],
-        FREQUENCIES_EXTENDED,
-        T_OPT_DEPENDENCY["A6"],
-        VOLUME_LIMITS["A6"]
-    ),
-    "Kino s vícekanálovým zvukem digitálním": RoomType(
-        "Kino s vícekanálovým zvukem digitálním", 
-        T60_LIMITS["A.7"],
-        FREQUENCIES_EXTENDED,
-        T_OPT_DEPENDENCY["A6"],
-        VOLUME_LIMITS["A6"]
-    ),
-    "Učebna a posluchárna": RoomType(
-        "Učebna a posluchárna", 
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        lambda volume: 0.7, # volume independent
-        (0, 250)
-    ),
-    "Posluchárna": RoomType(
-        "Posluchárna", 
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A1-3"],
-        (250, 20000)
-    ),
-    "Jazyková učebna (laboratoř)": RoomType(
-        "Jazyková učebna (laboratoř)", 
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        lambda volume: 0.45, # volume independent
-        (130, 180)
-    ),
-    "Audiovizuální učebna": RoomType(
-        "Audiovizuální učebna", 
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        lambda volume: 0.6, # volume independent
-        (200, 200)
-    ),
-    "Učebna hudební výchovy": RoomType(
-        "Učebna hudební výchovy", 
-        T60_LIMITS["A.3"],
-        FREQUENCIES,
-        lambda volume: 0.9, # volume independent
-        (200, 200)
-    ),
-    "Učebna hudební výchovy při reprodukované hudbě": RoomType(
-        "Učebna hudební výchovy při reprodukované hudbě", 
-        T60_LIMITS["A.3"],
-        FREQUENCIES,
-        lambda volume: 0.5, # volume independent
-        (200, 200)
-    ),
-    "Učebna hry na individuální nástroje a sólového zpěvu": RoomType(
-        "Učebna hry na individuální nástroje a sólového zpěvu", 
-        T60_LIMITS["A.3"],
-        FREQUENCIES,
-        lambda volume: 0.7, # volume independent
-        (80, 120)
-    ),
-    "Učebna orchestrání hry hudebních škol": RoomType(
-        "Učebna orchestrání hry hudebních škol", 
-        T60_LIMITS["A.2"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A1-2"],
-        VOLUME_LIMITS["A1-2"]
-    ),
-    "Tělocvična a plavecká hala všech typů škol": RoomType(
-        "Tělocvična a plavecká hala všech typů škol", 
-        T60_LIMITS["A.8"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A1-5"],
-        VOLUME_LIMITS["A1-5"]
-    ),
-    "Tělocvičny": RoomType(
-        "Tělocvičny", 
-        T60_LIMITS["A.8"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A1-5"],
-        VOLUME_LIMITS["A1-5"]
-    ),
-    "Sportovní haly": RoomType(
-        "Sportovní haly", 
-        T60_LIMITS["A.8"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A1-5"],
-        VOLUME_LIMITS["A1-5"]
-    ),
-    "Plavecké haly": RoomType(
-        "Plavecké haly", 
-        T60_LIMITS["A.8"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A1-5"],
-        VOLUME_LIMITS["A1-5"]
-    ),
-    "Nádražní haly": RoomType(
-        "Nádražní haly", 
-        T60_LIMITS["A.8"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A1-5"],
-        VOLUME_LIMITS["A1-5"]
-    ),
-    "Letištní haly": RoomType(
-        "Letištní haly", 
-        T60_LIMITS["A.8"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A1-5"],
-        VOLUME_LIMITS["A1-5"]
-    ),
-    "Haly a dvořany veřejných budov": RoomType(
-        "Haly a dvořany veřejných budov", 
-        T60_LIMITS["A.3"],
-        FREQUENCIES,
-        lambda volume: 1.4, # volume independent
-        None
-    )
-}
\ No newline at end of file
+def _constant_t_opt(value):
+    """ Returns a volume independent optimum T60 dependency. """
+    return lambda volume: np.full_like(np.asarray(volume, dtype=float), value)
+
+def _make_roomtype(name, limits_key, freqs, topt_key, vol_key=None):
+    """ Creates a RoomType referencing the shared module-level tables.
+
+    Parameters
+    ----------
+    name : str
+        Name of the room type.
+    limits_key : str
+        Key of the T60 limits in T60_LIMITS.
+    freqs : np.ndarray
+        Frequency bands of the limits.
+    topt_key : str | float
+        Key of the optimum T60 dependency in T_OPT_DEPENDENCY, or a constant
+        optimum T60 [s] for volume independent rooms.
+    vol_key : str | tuple, optional
+        Key of the volume limits in VOLUME_LIMITS or explicit (min, max)
+        volume limits [m^3]. Defaults to the limits of topt_key.
+    """
+    if isinstance(topt_key, str):
+        t_opt_dependency = T_OPT_DEPENDENCY[topt_key]
+        if vol_key is None:
+            vol_key = topt_key
+    else:
+        t_opt_dependency = _constant_t_opt(topt_key)
+    volume_limits = VOLUME_LIMITS[vol_key] if isinstance(vol_key, str) else vol_key
+    return RoomType(name, T60_LIMITS[limits_key], freqs, t_opt_dependency, volume_limits)
+
+ROOM_TYPES = {room.name: room for room in (
+    _make_roomtype("Opera", "A.2", FREQUENCIES, "A1-1"),
+    _make_roomtype("Hudební divadlo", "A.2", FREQUENCIES, "A1-1"),
+    _make_roomtype("Zkušebna orchestru", "A.2", FREQUENCIES, "A1-2"),
+    _make_roomtype("Víceúčelový sál", "A.3", FREQUENCIES, "A1-2"),
+    _make_roomtype("Činoherní divadlo", "A.4", FREQUENCIES, "A1-3"),
+    _make_roomtype("Zkušebna činohry", "A.4", FREQUENCIES, "A1-3"),
+    _make_roomtype("Přednáškový sál", "A.4", FREQUENCIES, "A1-3"),
+    _make_roomtype("Kino s jednokanálovým zvukem", "A.5", FREQUENCIES, "A1-4"),
+    _make_roomtype("Kino s vícekanálovým zvukem analogovým", "A.7", FREQUENCIES_EXTENDED, "A6"),
+    _make_roomtype("Kino s vícekanálovým zvukem digitálním", "A.7", FREQUENCIES_EXTENDED, "A6"),
+    _make_roomtype("Učebna a posluchárna", "A.4", FREQUENCIES, 0.7, (0, 250)),
+    _make_roomtype("Posluchárna", "A.4", FREQUENCIES, "A1-3", (250, 20000)),
+    _make_roomtype("Jazyková učebna (laboratoř)", "A.4", FREQUENCIES, 0.45, (130, 180)),
+    _make_roomtype("Audiovizuální učebna", "A.4", FREQUENCIES, 0.6, (200, 200)),
+    _make_roomtype("Učebna hudební výchovy", "A.3", FREQUENCIES, 0.9, (200, 200)),
+    _make_roomtype("Učebna hudební výchovy při reprodukované hudbě", "A.3", FREQUENCIES, 0.5, (200, 200)),
+    _make_roomtype("Učebna hry na individuální nástroje a sólového zpěvu", "A.3", FREQUENCIES, 0.7, (80, 120)),
+    _make_roomtype("Učebna orchestrání hry hudebních škol", "A.2", FREQUENCIES, "A1-2"),
+    _make_roomtype("Tělocvična a plavecká hala všech typů škol", "A.8", FREQUENCIES, "A1-5"),
+    _make_roomtype("Tělocvičny", "A.8", FREQUENCIES, "A1-5"),
+    _make_roomtype("Sportovní haly", "A.8", FREQUENCIES, "A1-5"),
+    _make_roomtype("Plavecké haly", "A.8", FREQUENCIES, "A1-5"),
+    _make_roomtype("Nádražní haly", "A.8", FREQUENCIES, "A1-5"),
+    _make_roomtype("Letištní haly", "A.8", FREQUENCIES, "A1-5"),
+    _make_roomtype("Haly a dvořany veřejných budov", "A.3", FREQUENCIES, 1.4, None),
+)}
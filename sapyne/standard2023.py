@@ -4,88 +4,251 @@ mainly the ČSN 73 0527. It defines various room types and their corresponding
 T60 limits, frequency bands, and optimal T60 dependencies based on room volume.
 
 Constants:
-    FREQUENCIES (list): Standard frequency bands.
-    FREQUENCIES_EXTENDED (list): Extended frequency bands.
+    FREQUENCIES (np.ndarray): Standard frequency bands (read-only).
+    FREQUENCIES_EXTENDED (np.ndarray): Extended frequency bands (read-only).
+    LIMIT_CODES (dict): Indices of the T60 limit codes in T60_LIMITS_ARR.
+    T60_LIMITS_ARR (np.ndarray): Read-only T60 limits (upper, lower) of all 
+                                 codes, shape (codes, 2, bands), NaN in 
+                                 the bands without a limit.
+    LIMIT_BANDS (np.ndarray): Read-only mask of the bands limited by each code, 
+                              shape (codes, bands), for NaN-free comparisons.
+    FREQ_MASK_A7 (np.ndarray): Bands limited by A.7.
+    T60_LIMITS_A7 (tuple): T60 limits (upper, lower) of the A.7 bands only.
     T60_LIMITS (dict): Dictionary containing T60 limits for different room types.
-    T_OPT_DEPENDENCY (dict): Dictionary containing lambda functions to calculate 
+    T_OPT_CODES (list): Codes of the optimal T60 dependencies.
+    T_OPT_DEPENDENCY (dict): Dictionary containing functions to calculate 
                              optimal T60 based on room volume.
     VOLUME_LIMITS (dict): Dictionary containing volume limits for different room types.
+    DEPS (np.ndarray): Read-only structured array of the dependency 
+                       coefficients (a, b) and volume limits (vmin, vmax).
+
+Functions:
+    t_opt: Optimal T60 for a dependency code and room volume.
+    t_opt_indexed: Optimal T60 for arrays of dependency indices and volumes.
+    t_opt_all: Optimal T60 of all dependencies for a room volume.
+    t_opt_latex: LaTeX formula of an optimal T60 dependency.
+    get_room: Index of a room type in ROOM_TABLE.
+    room: Room type by its name or ROOM_TABLE index.
+    rooms_matching: Room types whose volume limits include a volume.
 
 Classes:
-    RoomType: Dataclass representing a room type with attributes for name, 
+    RoomType: Dataclass representing a room type with attributes for 
               T60 limits, frequencies, optimal T60 dependency, and volume limits.
+    RoomTable: Structure-of-arrays table of the room types.
 
 Variables:
     ROOM_TYPES (dict): Dictionary containing instances of RoomType for various 
                        room types defined by the ČSN 73 0527.
+    ROOM_TABLE (RoomTable): The room types as a table of arrays, rows are 
+                            looked up by get_room.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import NamedTuple
 import numpy as np
 
 
-FREQUENCIES = [125, 250, 500, 1000, 2000, 4000]
-FREQUENCIES_EXTENDED = [63, 125, 250, 500, 1000, 2000, 4000, 8000]
+# shared by all room types, read-only so that no consumer needs a copy
+FREQUENCIES = np.array([125, 250, 500, 1000, 2000, 4000], dtype=np.int32)
+FREQUENCIES_EXTENDED = np.array(
+    [63, 125, 250, 500, 1000, 2000, 4000, 8000], dtype=np.int32
+)
+FREQUENCIES.setflags(write=False)
+FREQUENCIES_EXTENDED.setflags(write=False)
 
-T60_LIMITS = {
-    "A.4": ( # for both music and speech
+LIMIT_CODES = {"A.4": 0, "A.5": 1, "A.6": 2, "A.7": 3}
+
+# T60 limits (upper, lower) of shape (codes, 2, bands), rows follow LIMIT_CODES,
+# float64 so that measured values exactly at a limit compare as equal
+T60_LIMITS_ARR = np.array([
+    [ # A.4 for both music and speech
         [1.45, 1.2, 1.2, 1.2, 1.2, 1.2],
         [0.8, 0.8, 0.8, 0.8, 0.8, 0.65]
-    ),
-    "A.5": ( # for speech
+    ],
+    [ # A.5 for speech
         [1.2, 1.2, 1.2, 1.2, 1.2, 1.2],
         [0.65, 0.8, 0.8, 0.8, 0.8, 0.65]
-    ),
-    "A.6": ( # for music
+    ],
+    [ # A.6 for music
         [1.45, 1.2, 1.2, 1.2, 1.2, 1.2],
         [1, 0.8, 0.8, 0.8, 0.8, 0.65]
-    ),
-    "A.7": ( # limited bandwidth
+    ],
+    [ # A.7 limited bandwidth, no limits in the outer bands
         [np.nan, 1.2, 1.2, 1.2, 1.2, np.nan],
         [np.nan, 0.8, 0.8, 0.8, 0.8, np.nan]
-    )
-}
+    ]
+], dtype=np.float64)
 
-T_OPT_DEPENDENCY = {
-    "A.1-A": lambda volume: 0.731 * np.log10(volume) - 0.371,
-    "A.1-B": lambda volume: 0.523 * np.log10(volume) - 0.100,
-    "A.1-C": lambda volume: 0.430 * np.log10(volume),
-    "A.1-D": lambda volume: 0.396 * np.log10(volume) - 0.026,
-    "A.1-E": lambda volume: 0.310 * np.log10(volume) - 0.030,
-    "A.1-F": lambda volume: 0.250 * np.log10(volume) - 0.030,
-    "A.1-G": lambda volume: 0.310 * np.log10(volume) - 0.450,
-    "A.2-A": lambda volume: 0.342 * np.log10(volume) - 0.185,
-    "A.2-B": lambda volume: 0.300 * np.log10(volume) - 0.200,
-    "A.2-C1":lambda volume: 0.300 * np.log10(volume) + 0.150,
-    "A.2-C2":lambda volume: 0.300 * np.log10(volume),
-    "A.2-D": lambda volume: 0.150 * np.log10(volume),
-    "A.2-E": lambda volume: np.where(volume < 3000, 
-                           0.396 * np.log10(volume) + 0.023,
-                           1.036 * np.log10(volume) - 2.204),
-    "A.3-A": lambda volume: 0.342 * np.log10(volume) - 0.185,
-    "A.3-B": lambda volume: 0.342 * np.log10(volume) - 0.300,
-    "A.3-C": lambda volume: 0.650 * np.log10(volume) - 0.800,
-}
+# bands with a T60 limit, rows follow LIMIT_CODES; comparisons of the bands
+# selected by the mask (e.g. FREQ_MASK_A7 with T60_LIMITS_A7) need no NaN 
+# handling, the unlimited bands stay NaN in T60_LIMITS_ARR
+LIMIT_BANDS = ~np.isnan(T60_LIMITS_ARR).any(axis=1)
+# set before taking the views below, so that they are read-only as well
+T60_LIMITS_ARR.setflags(write=False)
+LIMIT_BANDS.setflags(write=False)
+
+FREQ_MASK_A7 = LIMIT_BANDS[LIMIT_CODES["A.7"]]
+# limits (upper, lower) of the A.7 bands selected by FREQ_MASK_A7
+T60_LIMITS_A7 = tuple(T60_LIMITS_ARR[LIMIT_CODES["A.7"]][:, FREQ_MASK_A7])
+for _limits in T60_LIMITS_A7:
+    _limits.setflags(write=False)
 
-T_OPT_DEPENDENCY_LATEX = {
-    "A.1-A": r"$T_{0} = 0.731 \cdot \log_{10}(V) - 0.371$",
-    "A.1-B": r"$T_{0} = 0.523 \cdot \log_{10}(V) - 0.100$",
-    "A.1-C": r"$T_{0} = 0.430 \cdot \log_{10}(V)$",
-    "A.1-D": r"$T_{0} = 0.396 \cdot \log_{10}(V) - 0.026$",
-    "A.1-E": r"$T_{0} = 0.310 \cdot \log_{10}(V) - 0.030$",
-    "A.1-F": r"$T_{0} = 0.250 \cdot \log_{10}(V) - 0.030$",
-    "A.1-G": r"$T_{0} = 0.310 \cdot \log_{10}(V) - 0.450$",
-    "A.2-A": r"$T_{0} = 0.342 \cdot \log_{10}(V) - 0.185$",
-    "A.2-B": r"$T_{0} = 0.300 \cdot \log_{10}(V) - 0.200$",
-    "A.2-C1": r"$T_{0} = 0.300 \cdot \log_{10}(V) + 0.150$",
-    "A.2-C2": r"$T_{0} = 0.300 \cdot \log_{10}(V)$",
-    "A.2-D": r"$T_{0} = 0.150 \cdot \log_{10}(V)$",
-    "A.2-E": r"$T_{0} = \begin{cases} 0.396 \cdot \log_{10}(V) + 0.023, & \text{if } V < 3000 \\ 1.036 \cdot \log_{10}(V) - 2.204, & \text{if } V \geq 3000 \end{cases}$",
-    "A.3-A": r"$T_{0} = 0.342 \cdot \log_{10}(V) - 0.185$",
-    "A.3-B": r"$T_{0} = 0.342 \cdot \log_{10}(V) - 0.300$",
-    "A.3-C": r"$T_{0} = 0.650 \cdot \log_{10}(V) - 0.800$"
+# read-only views into T60_LIMITS_ARR
+T60_LIMITS = {
+    code: (T60_LIMITS_ARR[i, 0], T60_LIMITS_ARR[i, 1])
+    for code, i in LIMIT_CODES.items()
 }
 
+# codes of the optimum T60 dependencies, rows of _COEFFS
+T_OPT_CODES = [
+    "A.1-A", "A.1-B", "A.1-C", "A.1-D", "A.1-E", "A.1-F", "A.1-G",
+    "A.2-A", "A.2-B", "A.2-C1", "A.2-C2", "A.2-D", "A.2-E",
+    "A.3-A", "A.3-B", "A.3-C"
+]
+_CODE_INDEX = {code: i for i, code in enumerate(T_OPT_CODES)}
+
+# slope and intercept of T_opt = a * log10(V) + b
+_COEFFS = np.array([
+    [0.731, -0.371],
+    [0.523, -0.100],
+    [0.430,  0.000],
+    [0.396, -0.026],
+    [0.310, -0.030],
+    [0.250, -0.030],
+    [0.310, -0.450],
+    [0.342, -0.185],
+    [0.300, -0.200],
+    [0.300,  0.150],
+    [0.300,  0.000],
+    [0.150,  0.000],
+    [1.036, -2.204], # A.2-E for V >= 3000 m^3
+    [0.342, -0.185],
+    [0.342, -0.300],
+    [0.650, -0.800],
+], dtype=np.float64)
+
+# A.2-E is piecewise, the coefficients below apply for V < 3000 m^3
+_A2E_VOLUME = 3000
+_A2E_COEFFS = (0.396, 0.023)
+
+_A2E_IDX = _CODE_INDEX["A.2-E"]
+
+def t_opt(code: str | int, volume):
+    """Optimum reverberation time for the given dependency.
+
+    Parameters
+    ----------
+    code : str | int
+        Code of the dependency, one of T_OPT_CODES, or its index.
+    volume : float | np.ndarray
+        Room volume [m^3].
+
+    Returns
+    -------
+    float | np.ndarray
+        Optimum reverberation time [s].
+    """
+    code_idx = _CODE_INDEX[code] if isinstance(code, str) else code
+    a, b = _COEFFS[code_idx]
+    if code_idx == _A2E_IDX:
+        # only the coefficients are selected, the logarithm is evaluated once
+        if np.ndim(volume) == 0:
+            if volume < _A2E_VOLUME:
+                a, b = _A2E_COEFFS
+        else:
+            small = np.asarray(volume) < _A2E_VOLUME
+            a = np.where(small, _A2E_COEFFS[0], a)
+            b = np.where(small, _A2E_COEFFS[1], b)
+    return a * np.log10(volume) + b
+
+def t_opt_indexed(code_idx, volume) -> np.ndarray:
+    """Optimum reverberation time for arrays of dependencies and volumes.
+
+    The dependency indices and volumes are broadcast against each other, 
+    e.g. ROOM_TABLE.dependency_idx evaluates all room types at once.
+
+    Parameters
+    ----------
+    code_idx : int | np.ndarray
+        Indices of the dependencies in T_OPT_CODES.
+    volume : float | np.ndarray
+        Room volumes [m^3].
+
+    Returns
+    -------
+    np.ndarray
+        Optimum reverberation times [s].
+    """
+    code_idx = np.asarray(code_idx)
+    volume = np.asarray(volume, dtype=np.float64)
+    coeffs = _COEFFS[code_idx]
+    # the lower branch of the piecewise A.2-E selected per element
+    small = (code_idx == _A2E_IDX) & (volume < _A2E_VOLUME)
+    a = np.where(small, _A2E_COEFFS[0], coeffs[..., 0])
+    b = np.where(small, _A2E_COEFFS[1], coeffs[..., 1])
+    return a * np.log10(volume) + b
+
+def t_opt_all(volume) -> np.ndarray:
+    """Optimum reverberation time of all dependencies for the given volume.
+
+    Parameters
+    ----------
+    volume : float | np.ndarray
+        Room volume [m^3].
+
+    Returns
+    -------
+    np.ndarray
+        Optimum reverberation times [s] of shape (..., codes), the last 
+        axis follows T_OPT_CODES.
+    """
+    volume = np.asarray(volume, dtype=np.float64)
+    # a single logarithm shared by all dependencies
+    log_volume = np.log10(volume)[..., None]
+    t = _COEFFS[:, 0] * log_volume + _COEFFS[:, 1]
+    small = volume < _A2E_VOLUME
+    t[..., _A2E_IDX] = np.where(
+        small,
+        _A2E_COEFFS[0] * log_volume[..., 0] + _A2E_COEFFS[1],
+        t[..., _A2E_IDX]
+    )
+    return t
+
+T_OPT_DEPENDENCY = {code: partial(t_opt, code) for code in T_OPT_CODES}
+
+def _latex_terms(a: float, b: float) -> str:
+    """LaTeX of a * log10(V) + b, the intercept is omitted if zero."""
+    terms = r"{:.3f} \cdot \log_{{10}}(V)".format(a)
+    if b:
+        terms += " {} {:.3f}".format("-" if b < 0 else "+", abs(b))
+    return terms
+
+@lru_cache(maxsize=None)
+def t_opt_latex(code: str) -> str:
+    """LaTeX formula of the optimum reverberation time dependency.
+
+    Parameters
+    ----------
+    code : str
+        Code of the dependency, one of T_OPT_CODES.
+
+    Returns
+    -------
+    str
+        The formula in LaTeX math mode.
+    """
+    a, b = _COEFFS[_CODE_INDEX[code]]
+    if code == "A.2-E":
+        return (
+            r"$T_{{0}} = \begin{{cases}} {}, & \text{{if }} V < {} \\ "
+            r"{}, & \text{{if }} V \geq {} \end{{cases}}$"
+        ).format(
+            _latex_terms(*_A2E_COEFFS), _A2E_VOLUME,
+            _latex_terms(a, b), _A2E_VOLUME
+        )
+    return "$T_{{0}} = {}$".format(_latex_terms(a, b))
+
 VOLUME_LIMITS = {
     "A.1-A": (800, 30_000),
     "A.1-B": (800, 20_000),
@@ -105,16 +268,30 @@ VOLUME_LIMITS = {
     "A.3-C": (300, 20_000)
 }
 
-@dataclass
+# slope, intercept and volume limits of every dependency, rows follow 
+# T_OPT_CODES, A.2-E holds the branch for V >= 3000 m^3
+DEPS = np.zeros(
+    len(T_OPT_CODES),
+    dtype=[("a", "f8"), ("b", "f8"), ("vmin", "f4"), ("vmax", "f4")]
+)
+DEPS["a"] = _COEFFS[:, 0]
+DEPS["b"] = _COEFFS[:, 1]
+DEPS["vmin"], DEPS["vmax"] = np.array(
+    [VOLUME_LIMITS[code] for code in T_OPT_CODES], dtype=np.float32
+).T
+DEPS.setflags(write=False)
+
+# eq=False keeps identity hashing, field-wise comparison is ambiguous for the
+# array limits
+@dataclass(frozen=True, slots=True, eq=False)
 class RoomType:
-    """ Dataclass for room types """
-    name: str
+    """ Dataclass for room types, named by their key in ROOM_TYPES """
     limits_str: str
     t_opt_dependency_str: str
-    limits: tuple
-    frequencies: list
+    limits: tuple[np.ndarray, np.ndarray]
+    frequencies: np.ndarray
     t_opt_dependency: callable
-    volume_limits: tuple = None
+    volume_limits: tuple | None = None
 
 
 ## A1
@@ -148,347 +325,156 @@ class RoomType:
 # 2. A3-B - Videokonferenční místnosti  
 # 3. A3-B - Jednací místnosti se zvýšeným nárokem na srozumitelnost (např. cizojazyčná jednání)  
 # 4. A3-C - Haly a dvorany veřejných budov (např. nádražní a letištní haly)
+# (name, limits code, dependency code)
+_ROOM_DEFS = [
+    ("Sály s převažující varhanní hudbou", "A.6", "A.1-A"),
+    ("Sály s převažující orchestrální hudbou", "A.6", "A.1-B"),
+    ("Sály s převažující komorní hudbou", "A.6", "A.1-C"),
+    ("Operní sály", "A.6", "A.1-C"),
+    ("Hudební zkušebny pro akustickou produkci (orchestr, sbor)", "A.4", "A.1-D"),
+    ("Činoherní divadla", "A.5", "A.1-E"),
+    ("Víceúčelové sály s převažujícím mluveným slovem bez ozvučení", "A.5", "A.1-E"),
+    ("Činoherní zkušebny", "A.5", "A.1-E"),
+    ("Hudební zkušebny pro ozvučenou produkci", "A.4", "A.1-F"),
+    ("Víceúčelové sály s převažující ozvučenou produkcí", "A.4", "A.1-F"),
+    ("Elektroakusticky ozvučené prostory", "A.4", "A.1-F"),
+    ("Kina a další prostory s vícekanálovým zvukovým systémem", "A.4", "A.1-G"),
+    ("Kmenové učebny", "A.5", "A.2-A"),
+    ("Odborné učebny", "A.5", "A.2-A"),
+    ("Učebny pracovní výuky", "A.5", "A.2-A"),
+    ("Seminární místnosti", "A.5", "A.2-A"),
+    ("Posluchárny", "A.5", "A.2-A"),
+    ("Denní místnosti mateřských škol", "A.5", "A.2-A"),
+    ("Hudební učebny", "A.4", "A.2-A"),
+    ("Jazykové učebny", "A.5", "A.2-B"),
+    ("Speciální učebny se zvýšeným nárokem na srozumitelnost", "A.5", "A.2-B"),
+    ("Multimediální učebny", "A.5", "A.2-B"),
+    ("Hudební učebny s reprodukovanou hudbou", "A.5", "A.2-B"),
+    ("Učebny pro elektronické a elektrofonické hudební nástroje", "A.4", "A.2-B"),
+    ("Učebny hry na individuální akustické nástroje a učebny zpěvu – horní mez", "A.4", "A.2-C1"),
+    ("Učebny hry na individuální akustické nástroje a učebny zpěvu – dolní mez", "A.4", "A.2-C2"),
+    ("Učebny hry na bicí nástroje", "A.4", "A.2-D"),
+    ("Tělocvičny a sportovní haly", "A.7", "A.2-E"),
+    ("Plavecké haly", "A.7", "A.2-E"),
+    ("Učebny gymnastiky a tance", "A.7", "A.2-E"),
+    ("Posilovny", "A.7", "A.2-E"),
+    ("Prostory pro fitness", "A.7", "A.2-E"),
+    ("Zasedací místnosti", "A.5", "A.3-A"),
+    ("Jednací místnosti", "A.5", "A.3-A"),
+    ("Školicí místnosti", "A.5", "A.3-A"),
+    ("Videokonferenční místnosti", "A.5", "A.3-B"),
+    ("Jednací místnosti se zvýšeným nárokem na srozumitelnost (např. cizojazyčná jednání)", "A.5", "A.3-B"),
+    ("Haly a dvorany veřejných budov (např. nádražní a letištní haly)", "A.7", "A.3-C"),
+]
+
+def _shared_room_type(limits_code: str, dependency_code: str) -> RoomType:
+    """RoomType shared by all room names with the same codes."""
+    key = (limits_code, dependency_code)
+    if key not in _UNIQUE_ROOM_TYPES:
+        _UNIQUE_ROOM_TYPES[key] = RoomType(
+            limits_code,
+            dependency_code,
+            T60_LIMITS[limits_code],
+            FREQUENCIES,
+            T_OPT_DEPENDENCY[dependency_code],
+            VOLUME_LIMITS[dependency_code]
+        )
+    return _UNIQUE_ROOM_TYPES[key]
+
+_UNIQUE_ROOM_TYPES = {}
 ROOM_TYPES = {
-    "Sály s převažující varhanní hudbou": RoomType(
-        "Sály s převažující varhanní hudbou", 
-        "A.6",
-        "A.1-A",
-        T60_LIMITS["A.6"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.1-A"],
-        VOLUME_LIMITS["A.1-A"]
-    ),
-    "Sály s převažující orchestrální hudbou": RoomType(
-        "Sály s převažující orchestrální hudbou", 
-        "A.6",
-        "A.1-B",
-        T60_LIMITS["A.6"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.1-B"],
-        VOLUME_LIMITS["A.1-B"]
-    ),
-    "Sály s převažující komorní hudbou": RoomType(
-        "Sály s převažující komorní hudbou", 
-        "A.6",
-        "A.1-C",
-        T60_LIMITS["A.6"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.1-C"],
-        VOLUME_LIMITS["A.1-C"]
-    ),
-    "Operní sály": RoomType(
-        "Operní sály", 
-        "A.6",
-        "A.1-C",
-        T60_LIMITS["A.6"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.1-C"],
-        VOLUME_LIMITS["A.1-C"]
-    ),
-    "Hudební zkušebny pro akustickou produkci (orchestr, sbor)": RoomType(
-        "Hudební zkušebny pro akustickou produkci (orchestr, sbor)", 
-        "A.4",
-        "A.1-D",
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.1-D"],
-        VOLUME_LIMITS["A.1-D"]
-    ),
-    "Činoherní divadla": RoomType(
-        "Činoherní divadla", 
-        "A.5",
-        "A.1-E",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.1-E"],
-        VOLUME_LIMITS["A.1-E"]
-    ),
-    "Víceúčelové sály s převažujícím mluveným slovem bez ozvučení": RoomType(
-        "Víceúčelové sály s převažujícím mluveným slovem bez ozvučení", 
-        "A.5",
-        "A.1-E",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.1-E"],
-        VOLUME_LIMITS["A.1-E"]
-    ),
-    "Činoherní zkušebny": RoomType(
-        "Činoherní zkušebny", 
-        "A.5",
-        "A.1-E",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.1-E"],
-        VOLUME_LIMITS["A.1-E"]
-    ),
-    "Hudební zkušebny pro ozvučenou produkci": RoomType(
-        "Hudební zkušebny pro ozvučenou produkci", 
-        "A.4",
-        "A.1-F",
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.1-F"],
-        VOLUME_LIMITS["A.1-F"]
-    ),
-    "Víceúčelové sály s převažující ozvučenou produkcí": RoomType(
-        "Víceúčelové sály s převažující ozvučenou produkcí", 
-        "A.4",
-        "A.1-F",
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.1-F"],
-        VOLUME_LIMITS["A.1-F"]
-    ),
-    "Elektroakusticky ozvučené prostory": RoomType(
-        "Elektroakusticky ozvučené prostory", 
-        "A.4",
-        "A.1-F",
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.1-F"],
-        VOLUME_LIMITS["A.1-F"]
-    ),
-    "Kina a další prostory s vícekanálovým zvukovým systémem": RoomType(
-        "Kina a další prostory s vícekanálovým zvukovým systémem", 
-        "A.4",
-        "A.1-G",
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.1-G"],
-        VOLUME_LIMITS["A.1-G"]
-    ),
-    "Kmenové učebny": RoomType(
-        "Kmenové učebny", 
-        "A.5",
-        "A.2-A",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-A"],
-        VOLUME_LIMITS["A.2-A"]
-    ),
-    "Odborné učebny": RoomType(
-        "Odborné učebny", 
-        "A.5",
-        "A.2-A",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-A"],
-        VOLUME_LIMITS["A.2-A"]
-    ),
-    "Učebny pracovní výuky": RoomType(
-        "Učebny pracovní výuky", 
-        "A.5",
-        "A.2-A",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-A"],
-        VOLUME_LIMITS["A.2-A"]
-    ),
-    "Seminární místnosti": RoomType(
-        "Seminární místnosti", 
-        "A.5",
-        "A.2-A",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-A"],
-        VOLUME_LIMITS["A.2-A"]
-    ),
-    "Posluchárny": RoomType(
-        "Posluchárny", 
-        "A.5",
-        "A.2-A",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-A"],
-        VOLUME_LIMITS["A.2-A"]
-    ),
-    "Denní místnosti mateřských škol": RoomType(
-        "Denní místnosti mateřských škol", 
-        "A.5",
-        "A.2-A",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-A"],
-        VOLUME_LIMITS["A.2-A"]
-    ),
-    "Hudební učebny": RoomType(
-        "Hudební učebny", 
-        "A.4",
-        "A.2-A",
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-A"],
-        VOLUME_LIMITS["A.2-A"]
-    ),
-    "Jazykové učebny": RoomType(
-        "Jazykové učebny", 
-        "A.5",
-        "A.2-B",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-B"],
-        VOLUME_LIMITS["A.2-B"]
-    ),
-    "Speciální učebny se zvýšeným nárokem na srozumitelnost": RoomType(
-        "Speciální učebny se zvýšeným nárokem na srozumitelnost", 
-        "A.5",
-        "A.2-B",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-B"],
-        VOLUME_LIMITS["A.2-B"]
-    ),
-    "Multimediální učebny": RoomType(
-        "Multimediální učebny", 
-        "A.5",
-        "A.2-B",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-B"],
-        VOLUME_LIMITS["A.2-B"]
-    ),
-    "Hudební učebny s reprodukovanou hudbou": RoomType(
-        "Hudební učebny s reprodukovanou hudbou", 
-        "A.5",
-        "A.2-B",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-B"],
-        VOLUME_LIMITS["A.2-B"]
-    ),
-    "Učebny pro elektronické a elektrofonické hudební nástroje": RoomType(
-        "Učebny pro elektronické a elektrofonické hudební nástroje", 
-        "A.4",
-        "A.2-B",
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-B"],
-        VOLUME_LIMITS["A.2-B"]
-    ),
-    "Učebny hry na individuální akustické nástroje a učebny zpěvu – horní mez": RoomType(
-        "Učebny hry na individuální akustické nástroje a učebny zpěvu – horní mez", 
-        "A.4",
-        "A.2-C1",
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-C1"],
-        VOLUME_LIMITS["A.2-C1"]
-    ),
-    "Učebny hry na individuální akustické nástroje a učebny zpěvu – dolní mez": RoomType(
-        "Učebny hry na individuální akustické nástroje a učebny zpěvu – dolní mez", 
-        "A.4",
-        "A.2-C2",
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-C2"],
-        VOLUME_LIMITS["A.2-C2"]
-    ),
-    "Učebny hry na bicí nástroje": RoomType(
-        "Učebny hry na bicí nástroje", 
-        "A.4",
-        "A.2-D",
-        T60_LIMITS["A.4"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-D"],
-        VOLUME_LIMITS["A.2-D"]
-    ),
-    "Tělocvičny a sportovní haly": RoomType(
-        "Tělocvičny a sportovní haly", 
-        "A.7",
-        "A.2-E",
-        T60_LIMITS["A.7"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-E"],
-        VOLUME_LIMITS["A.2-E"]
-    ),
-    "Plavecké haly": RoomType(
-        "Plavecké haly", 
-        "A.7",
-        "A.2-E",
-        T60_LIMITS["A.7"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-E"],
-        VOLUME_LIMITS["A.2-E"]
-    ),
-    "Učebny gymnastiky a tance": RoomType(
-        "Učebny gymnastiky a tance", 
-        "A.7",
-        "A.2-E",
-        T60_LIMITS["A.7"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-E"],
-        VOLUME_LIMITS["A.2-E"]
-    ),
-    "Posilovny": RoomType(
-        "Posilovny", 
-        "A.7",
-        "A.2-E",
-        T60_LIMITS["A.7"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-E"],
-        VOLUME_LIMITS["A.2-E"]
-    ),
-    "Prostory pro fitness": RoomType(
-        "Prostory pro fitness", 
-        "A.7",
-        "A.2-E",
-        T60_LIMITS["A.7"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.2-E"],
-        VOLUME_LIMITS["A.2-E"]
-    ),
-    "Zasedací místnosti": RoomType(
-        "Zasedací místnosti",
-        "A.5",
-        "A.3-A",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.3-A"],
-        VOLUME_LIMITS["A.3-A"]
-    ),
-    "Jednací místnosti": RoomType(
-        "Jednací místnosti",
-        "A.5",
-        "A.3-A",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.3-A"],
-        VOLUME_LIMITS["A.3-A"]
-    ),
-    "Školicí místnosti": RoomType(
-        "Školicí místnosti",
-        "A.5",
-        "A.3-A",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.3-A"],
-        VOLUME_LIMITS["A.3-A"]
-    ),
-    "Videokonferenční místnosti": RoomType(
-        "Videokonferenční místnosti",
-        "A.5",
-        "A.3-B",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.3-B"],
-        VOLUME_LIMITS["A.3-B"]
-    ),
-    "Jednací místnosti se zvýšeným nárokem na srozumitelnost (např. cizojazyčná jednání)": RoomType(
-        "Jednací místnosti se zvýšeným nárokem na srozumitelnost (např. cizojazyčná jednání)",
-        "A.5",
-        "A.3-B",
-        T60_LIMITS["A.5"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.3-B"],
-        VOLUME_LIMITS["A.3-B"]
-    ),
-    "Haly a dvorany veřejných budov (např. nádražní a letištní haly)": RoomType(
-        "Haly a dvorany veřejných budov (např. nádražní a letištní haly)",
-        "A.7",
-        "A.3-C",
-        T60_LIMITS["A.7"],
-        FREQUENCIES,
-        T_OPT_DEPENDENCY["A.3-C"],
-        VOLUME_LIMITS["A.3-C"]
+    name: _shared_room_type(limits_code, dependency_code)
+    for name, limits_code, dependency_code in _ROOM_DEFS
+}
+
+class RoomTable(NamedTuple):
+    """ Structure-of-arrays representation of ROOM_TYPES.
+
+    Row i of every array describes the room type names[i].
+
+    Structure:
+    ----------
+    names : list
+        Names of the room types.
+    limit_idx : np.ndarray
+        Indices of the limit codes, rows of T60_LIMITS_ARR (int8).
+    dependency_idx : np.ndarray
+        Indices of the optimum T60 dependencies in T_OPT_CODES (int8).
+    volume_limits : np.ndarray
+        Volume limits (min, max) of shape (rooms, 2) [m^3] (float32).
+    """
+    names: list
+    limit_idx: np.ndarray
+    dependency_idx: np.ndarray
+    volume_limits: np.ndarray
+
+_dependency_idx = np.array(
+    [_CODE_INDEX[code] for _, _, code in _ROOM_DEFS], dtype=np.int8
+)
+ROOM_TABLE = RoomTable(
+    [name for name, _, _ in _ROOM_DEFS],
+    np.array([LIMIT_CODES[code] for _, code, _ in _ROOM_DEFS], dtype=np.int8),
+    _dependency_idx,
+    np.column_stack((DEPS["vmin"], DEPS["vmax"]))[_dependency_idx]
+)
+
+for _column in ROOM_TABLE[1:]:
+    _column.setflags(write=False)
+
+_ROOM_INDEX = {name: i for i, name in enumerate(ROOM_TABLE.names)}
+
+def get_room(name: str) -> int:
+    """Row of the room type in ROOM_TABLE.
+
+    Parameters
+    ----------
+    name : str
+        Name of the room type, a key of ROOM_TYPES.
+
+    Returns
+    -------
+    int
+        Index of the room type in the ROOM_TABLE arrays.
+    """
+    return _ROOM_INDEX[name]
+
+# room types in the order of ROOM_TABLE rows
+_ROOM_SEQUENCE = tuple(ROOM_TYPES.values())
+
+def room(key: str | int) -> RoomType:
+    """Room type by its name or by its index from get_room.
+
+    Callers looking up the same room repeatedly can keep the integer 
+    index, which avoids hashing the long name on every lookup.
+
+    Parameters
+    ----------
+    key : str | int
+        Name of the room type or its index in ROOM_TABLE.
+
+    Returns
+    -------
+    RoomType
+        The room type.
+    """
+    if isinstance(key, str):
+        key = _ROOM_INDEX[key]
+    return _ROOM_SEQUENCE[key]
+
+def rooms_matching(volume: float) -> np.ndarray:
+    """Room types whose volume limits include the given volume.
+
+    Parameters
+    ----------
+    volume : float
+        Room volume [m^3].
+
+    Returns
+    -------
+    np.ndarray
+        Indices of the matching room types in ROOM_TABLE.
+    """
+    volume_limits = ROOM_TABLE.volume_limits
+    return np.flatnonzero(
+        (volume >= volume_limits[:, 0]) & (volume <= volume_limits[:, 1])
     )
-}
\ No newline at end of file